@@ -36,7 +36,7 @@ def fix_resources_imports(path):
 def build_ui(input_path, output_path, force):
     """Converts given .ui file to .py."""
     print("Building " + os.path.basename(output_path))
-    status = os.system(f"pyside6-uic --from-imports \"{input_path}\" -o \"{output_path}\"")
+    status = os.system(f"pyside6-uic --from-imports --no-autoconnection \"{input_path}\" -o \"{output_path}\"")
     if status != 0:
         print("Stop. Build failed.")
         exit(1)
@@ -28,6 +28,11 @@ import pathlib
 import bisect
 from contextlib import contextmanager
 import tempfile
+
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
 import matplotlib
 from PySide6.QtCore import Qt, Slot, QFile, QIODevice, QSize, QRect, QPoint, QUrl, QObject, QEvent
 from PySide6.QtCore import __version__ as qt_version
@@ -138,7 +143,7 @@ def create_dir(base_path, folder="", verbosity=False):
         OSError if operation failed.
     """
     directory = os.path.join(base_path, folder)
-    if os.path.exists(directory) and verbosity:
+    if verbosity and os.path.exists(directory):
         logging.debug("Directory found: %s", directory)
     else:
         os.makedirs(directory, exist_ok=True)
@@ -352,31 +357,38 @@ def recursive_overwrite(logger, src, dst, ignore=None, silent=True):
         ignore (Callable, optional): Ignore function
         silent (bool): If False, messages are sent to Event Log, If True, copying is done in silence
     """
-    if os.path.isdir(src):
-        if not os.path.isdir(dst):
-            if not silent:
-                logger.msg.emit("Creating directory <b>{0}</b>".format(dst))
-            os.makedirs(dst)
-        files = os.listdir(src)
-        for file_name in list(files):
-            # Avoid ending up in 'dst' as this would result in infinite recursion.
-            file_path = os.path.join(src, file_name)
-            if os.path.samefile(os.path.commonpath((file_path, dst)), file_path):
-                files.remove(file_name)
-                break
-        if ignore is not None:
-            ignored = ignore(src, files)
-        else:
-            ignored = set()
-        for f in files:
-            if f not in ignored:
-                recursive_overwrite(logger, os.path.join(src, f), os.path.join(dst, f), ignore, silent)
-    else:
+    if not os.path.isdir(src):
         if not silent:
             _, src_filename = os.path.split(src)
             dst_dir, _ = os.path.split(dst)
             logger.msg.emit("Copying <b>{0}</b> -> <b>{1}</b>".format(src_filename, dst_dir))
         shutil.copyfile(src, dst)
+        return
+
+    dst_path = os.path.normcase(os.path.abspath(dst))
+
+    def ignore_files(directory, files):
+        ignored = set(ignore(directory, files)) if ignore is not None else set()
+        # Avoid ending up in 'dst' as this would result in infinite recursion.
+        directory_path = os.path.normcase(os.path.abspath(directory))
+        try:
+            contains_dst = os.path.commonpath((directory_path, dst_path)) == directory_path
+        except ValueError:
+            # Paths are on different drives.
+            return ignored
+        if contains_dst and dst_path != directory_path:
+            dst_root = os.path.relpath(dst_path, directory_path).split(os.sep, 1)[0]
+            for file_name in files:
+                if os.path.normcase(file_name) == dst_root:
+                    ignored.add(file_name)
+                    break
+        return ignored
+
+    if not silent and not os.path.isdir(dst):
+        logger.msg.emit("Creating directory <b>{0}</b>".format(dst))
+    shutil.copytree(src, dst, ignore=ignore_files, copy_function=shutil.copyfile, dirs_exist_ok=True)
+    if not silent:
+        logger.msg.emit("Copied <b>{0}</b> -> <b>{1}</b>".format(src, dst))
 
 
 def tuple_itemgetter(itemgetter_func, num_indexes):
@@ -1472,9 +1484,9 @@ def load_project_dict(project_config_dir, logger):
     """
     load_path = os.path.abspath(os.path.join(project_config_dir, PROJECT_FILENAME))
     try:
-        with open(load_path, "r") as fh:
+        with open(load_path, "rb") as fh:
             try:
-                project_dict = json.load(fh)
+                project_dict = _load_json(fh.read())
             except json.decoder.JSONDecodeError:
                 logger.msg_error.emit(f"Error in project file <b>{load_path}</b>. Invalid JSON.")
                 return None
@@ -1484,6 +1496,26 @@ def load_project_dict(project_config_dir, logger):
     return project_dict
 
 
+def _load_json(data):
+    """Deserializes JSON using orjson if it is available.
+
+    Falls back to the standard library parser if orjson is not installed
+    or fails to parse something json accepts, e.g. NaN.
+
+    Args:
+        data (bytes): JSON document
+
+    Returns:
+        Any: deserialized document
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
 def load_local_project_data(project_config_dir, logger):
     """Loads local project data.
 
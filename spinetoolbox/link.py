@@ -278,6 +278,7 @@ class _IconBase(QGraphicsEllipseItem):
             self.setToolTip(tooltip)
         self.setAcceptHoverEvents(True)
         self.setFlag(QGraphicsItem.ItemIsSelectable, enabled=False)
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
         self.setBrush(palette.window())
 
     def hoverEnterEvent(self, event):
@@ -104,8 +104,11 @@ class EmptyRowModel(MinimalTableModel):
                 field = None
             default = self.default_row.get(field)
             default_row.append(default)
-        for row in range(first, last + 1):
+        changed_rows = [row for row in range(first, last + 1) if self._main_data[row] != default_row]
+        if not changed_rows:
+            return
+        for row in changed_rows:
             self._main_data[row] = default_row.copy()
-        top_left = self.index(first, 0)
-        bottom_right = self.index(last, self.columnCount() - 1)
+        top_left = self.index(changed_rows[0], 0)
+        bottom_right = self.index(changed_rows[-1], self.columnCount() - 1)
         self.dataChanged.emit(top_left, bottom_right)
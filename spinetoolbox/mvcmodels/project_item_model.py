@@ -354,5 +354,7 @@ class ProjectItemModel(QAbstractItemModel):
         self.beginResetModel()
         for row in range(self.rowCount()):
             category_index = self.index(row, 0)
-            category_index.internalPointer().children().clear()
+            category = category_index.internalPointer()
+            for child_row in reversed(range(category.child_count())):
+                category.remove_child(child_row)
         self.endResetModel()
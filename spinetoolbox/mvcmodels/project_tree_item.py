@@ -31,6 +31,7 @@ class BaseProjectTreeItem(MetaObject):
         super().__init__(name, description)
         self._parent = None  # Parent BaseProjectTreeItem. Set when add_child is called
         self._children = list()  # Child BaseProjectTreeItems. Appended when new items are inserted into model.
+        self._child_index = {}  # Maps id of child BaseProjectTreeItem to its row.
 
     def flags(self):  # pylint: disable=no-self-use
         """Returns the item flags."""
@@ -67,11 +68,18 @@ class BaseProjectTreeItem(MetaObject):
     def row(self):
         """Returns the row on which this item is located."""
         if self._parent is not None:
-            r = self._parent.children().index(self)
-            # logging.debug("{0} is on row:{1}".format(self.name, r))
-            return r
+            return self._parent._child_index[id(self)]
         return 0
 
+    def _update_child_index(self, first=0):
+        """Updates the rows of children starting from given row.
+
+        Args:
+            first (int): first row to update
+        """
+        for row in range(first, len(self._children)):
+            self._child_index[id(self._children[row])] = row
+
     def add_child(self, child_item):
         """Base method that shall be overridden in subclasses."""
         raise NotImplementedError()
@@ -90,6 +98,8 @@ class BaseProjectTreeItem(MetaObject):
             return False
         child = self._children.pop(row)
         child._parent = None
+        del self._child_index[id(child)]
+        self._update_child_index(row)
         return True
 
     def custom_context_menu(self, toolbox):
@@ -120,6 +130,7 @@ class RootProjectTreeItem(BaseProjectTreeItem):
             True for success, False otherwise
         """
         if isinstance(child_item, CategoryProjectTreeItem):
+            self._child_index[id(child_item)] = len(self._children)
             self._children.append(child_item)
             child_item._parent = self
             return True
@@ -153,6 +164,7 @@ class CategoryProjectTreeItem(BaseProjectTreeItem):
         pos = bisect.bisect_left([key(x) for x in self._children], key(child_item))
         self._children.insert(pos, child_item)
         child_item._parent = self
+        self._update_child_index(pos)
         return True
 
     def custom_context_menu(self, toolbox):
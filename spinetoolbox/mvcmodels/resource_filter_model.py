@@ -23,7 +23,6 @@ class ResourceFilterModel(QStandardItemModel):
     tree_built = Signal()
     _SELECT_ALL = "Select all"
     _FILTER_TYPES = {"Scenario filter": SCENARIO_FILTER_TYPE, "Tool filter": TOOL_FILTER_TYPE}
-    _FILTER_TYPE_TO_TEXT = dict(zip(_FILTER_TYPES.values(), _FILTER_TYPES.keys()))
 
     def __init__(self, connection, project, undo_stack, logger):
         """
@@ -38,32 +37,63 @@ class ResourceFilterModel(QStandardItemModel):
         self._project = project
         self._undo_stack = undo_stack
         self._logger = logger
+        self._filter_type_items = {}
+        self._filter_rows = {}
+        self._offline_filters = {}
+        self._tree_signature = None
 
     @property
     def connection(self):
         return self._connection
 
     def build_tree(self):
-        """Rebuilds model's contents."""
+        """Rebuilds model's contents if available filters or their online states have changed since last build."""
 
         def append_filter_items(parent_item, filter_names, filter_type, online, online_default):
+            rows = {}
+            offline = set()
             for name in filter_names[filter_type]:
                 filter_item = QStandardItem(name)
-                filter_item.setCheckState(
-                    Qt.CheckState.Checked if online.get(name, online_default) else Qt.CheckState.Unchecked
-                )
+                if online.get(name, online_default):
+                    filter_item.setCheckState(Qt.CheckState.Checked)
+                else:
+                    filter_item.setCheckState(Qt.CheckState.Unchecked)
+                    offline.add(name)
                 filter_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsUserCheckable)
+                rows[name] = parent_item.rowCount()
                 parent_item.appendRow(filter_item)
-
+            return rows, offline
+
+        resources = [resource for resource in self._connection.database_resources if resource.url]
+        # Online maps are keyed by available filter names, so they capture both filters and their states.
+        online_filters = {
+            (resource.label, type_): self._connection.online_filters(resource.label, type_)
+            for resource in resources
+            for type_ in self._FILTER_TYPES.values()
+        }
+        signature = (
+            [(resource.label, resource.url) for resource in resources],
+            online_filters,
+            self._connection.is_filter_online_by_default,
+        )
+        if signature == self._tree_signature:
+            self.tree_built.emit()
+            return
+        self._tree_signature = signature
+        filters = self.fetch_filters()
         self.clear()
+        self._filter_type_items.clear()
+        self._filter_rows.clear()
+        self._offline_filters.clear()
         self.setHorizontalHeaderItem(0, QStandardItem("DB resource filters"))
-        filters = self.fetch_filters()
+        root_items = []
         for resource_label, filters_by_type in filters.items():
             root_item = QStandardItem(resource_label)
             root_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-            self.appendRow(root_item)
+            root_items.append(root_item)
             for type_label, type_ in self._FILTER_TYPES.items():
                 filter_parent = QStandardItem(type_label)
+                self._filter_type_items[resource_label, type_] = filter_parent
                 if not filters_by_type.get(type_):
                     no_filters_item = QStandardItem("None available")
                     no_filters_item.setFlags(Qt.ItemIsSelectable)
@@ -76,11 +106,19 @@ class ResourceFilterModel(QStandardItemModel):
                 select_all_item.setCheckState(Qt.CheckState.Unchecked)
                 filter_parent.appendRow(select_all_item)
                 root_item.appendRow(filter_parent)
-                online_filters = self._connection.online_filters(resource_label, type_)
-                append_filter_items(
-                    filter_parent, filters_by_type, type_, online_filters, self._connection.is_filter_online_by_default
+                rows, offline = append_filter_items(
+                    filter_parent,
+                    filters_by_type,
+                    type_,
+                    online_filters[resource_label, type_],
+                    self._connection.is_filter_online_by_default,
                 )
-                self._set_all_selected_item(resource_label, filter_parent)
+                self._filter_rows[resource_label, type_] = rows
+                self._offline_filters[resource_label, type_] = offline
+                self._set_all_selected_item(resource_label, type_)
+        if root_items:
+            # Items are populated before they are attached to the model to avoid per-row change notifications.
+            self.invisibleRootItem().appendRows(root_items)
         self.tree_built.emit()
 
     def fetch_filters(self):
@@ -118,7 +156,7 @@ class ResourceFilterModel(QStandardItemModel):
         root_item = resource_type_item.parent()
         resource_label = root_item.text()
         if item.text() == self._SELECT_ALL:
-            activated = {resource_type_item.child(row).text(): is_on for row in range(1, resource_type_item.rowCount())}
+            activated = dict.fromkeys(self._filter_rows.get((resource_label, filter_type), ()), is_on)
             cmd = SetFiltersOnlineCommand(self._project, self.connection, resource_label, filter_type, activated)
         else:
             cmd = SetFiltersOnlineCommand(
@@ -136,47 +174,36 @@ class ResourceFilterModel(QStandardItemModel):
         """
         self.connection.set_online(resource, filter_type, online)
         self.connection.link.update_icons()
-        filter_type_item = self._find_filter_type_item(resource, filter_type)
-        for row in range(filter_type_item.rowCount()):
+        filter_type_item = self._filter_type_items.get((resource, filter_type))
+        filter_rows = self._filter_rows.get((resource, filter_type))
+        if filter_type_item is None or filter_rows is None:
+            return
+        offline = self._offline_filters[resource, filter_type]
+        for name, is_on in online.items():
+            row = filter_rows.get(name)
+            if row is None:
+                continue
+            if is_on:
+                offline.discard(name)
+            else:
+                offline.add(name)
             filter_item = filter_type_item.child(row)
-            is_on = online.get(filter_item.text(), None)
-            if is_on is not None:
-                checked = Qt.CheckState.Checked if is_on else Qt.CheckState.Unchecked
-                if filter_item.data(Qt.ItemDataRole.CheckStateRole) != checked.value:
-                    filter_item.setCheckState(checked)
-                    self.dataChanged.emit(filter_item.index(), filter_item.index(), [Qt.ItemDataRole.CheckStateRole])
-        self._set_all_selected_item(resource, filter_type_item, True)
+            checked = Qt.CheckState.Checked if is_on else Qt.CheckState.Unchecked
+            if filter_item.data(Qt.ItemDataRole.CheckStateRole) != checked.value:
+                filter_item.setCheckState(checked)
+                self.dataChanged.emit(filter_item.index(), filter_item.index(), [Qt.ItemDataRole.CheckStateRole])
+        self._set_all_selected_item(resource, filter_type, True)
 
-    def _find_filter_type_item(self, resource, filter_type):
-        """Searches for filter type item.
-
-        Args:
-            resource (str): resource label
-            filter_type (str): filter type identifier
-
-        Returns:
-            QStandardItem: filter type item or None if not found
-        """
-        root_item = self.findItems(resource)[0]
-        filter_type_item = None
-        filter_type_text = self._FILTER_TYPE_TO_TEXT[filter_type]
-        for row in range(root_item.rowCount()):
-            filter_type_item = root_item.child(row)
-            if filter_type_item.text() == filter_type_text:
-                break
-        return filter_type_item
-
-    def _set_all_selected_item(self, resource, filter_type_item, emit_data_changed=False):
+    def _set_all_selected_item(self, resource, filter_type, emit_data_changed=False):
         """Updates 'Select All' item's checked state.
 
         Args:
             resource (str): resource label
-            filter_type_item (QStandardItem): filter type item
+            filter_type (str): filter type identifier
             emit_data_changed (bool): if True, emit dataChanged signal if the state was updated
         """
-        online_filters = self._connection.online_filters(resource, self._FILTER_TYPES[filter_type_item.text()])
-        all_online = all(online_filters.values())
-        all_selected_item = filter_type_item.child(0)
+        all_online = not self._offline_filters[resource, filter_type]
+        all_selected_item = self._filter_type_items[resource, filter_type].child(0)
         all_selected = all_selected_item.data(Qt.ItemDataRole.CheckStateRole) == Qt.CheckState.Checked.value
         if all_selected != all_online:
             checked = Qt.CheckState.Checked if all_online else Qt.CheckState.Unchecked
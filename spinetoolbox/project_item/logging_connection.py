@@ -19,6 +19,9 @@ from ..mvcmodels.resource_filter_model import ResourceFilterModel
 from ..helpers import busy_effect
 from ..fetch_parent import FlexibleFetchParent
 
+_DATABASE_ITEM_TYPES = {SCENARIO_FILTER_TYPE: "scenario", TOOL_FILTER_TYPE: "tool"}
+_QUERY_BATCH_SIZE = 256
+
 
 class HeadlessConnection(ResourceConvertingConnection):
     """A project item connection that is compatible with headless mode."""
@@ -68,27 +71,10 @@ class HeadlessConnection(ResourceConvertingConnection):
             url = resource.url
             if not url:
                 continue
-            try:
-                db_map = DatabaseMapping(url)
-            except (SpineDBAPIError, SpineDBVersionError):
-                continue
-            try:
-                scenario_filter_ids = resource_filter_ids.get(SCENARIO_FILTER_TYPE)
-                if scenario_filter_ids is not None:
-                    specific_filter_settings = self._filter_settings.known_filters.setdefault(
-                        resource.label, {}
-                    ).setdefault(SCENARIO_FILTER_TYPE, {})
-                    for row in db_map.query(db_map.scenario_sq):
-                        specific_filter_settings[row.name]: row.id = row.id in scenario_filter_ids
-                tool_filter_ids = resource_filter_ids.get(TOOL_FILTER_TYPE)
-                if tool_filter_ids is not None:
-                    specific_filter_settings = self._filter_settings.known_filters.setdefault(
-                        resource.label, {}
-                    ).setdefault(TOOL_FILTER_TYPE, {})
-                    for row in db_map.query(db_map.tool_sq):
-                        specific_filter_settings[row.name] = row.id in tool_filter_ids
-            finally:
-                db_map.connection.close()
+            for filter_type, settings in _legacy_filter_settings(url, resource_filter_ids).items():
+                self._filter_settings.known_filters.setdefault(resource.label, {}).setdefault(filter_type, {}).update(
+                    settings
+                )
         self._legacy_resource_filter_ids = None
 
     @staticmethod
@@ -388,7 +374,7 @@ class LoggingConnection(LogMixin, HeadlessConnection):
         db_map = self._get_db_map(url)
         if db_map is None:
             return None
-        db_item_type = {SCENARIO_FILTER_TYPE: "scenario", TOOL_FILTER_TYPE: "tool"}[filter_type]
+        db_item_type = _DATABASE_ITEM_TYPES[filter_type]
         available_filters = (
             x["name"] for x in self._toolbox.db_mngr.get_items(db_map, db_item_type, only_visible=True)
         )
@@ -419,6 +405,35 @@ class LoggingConnection(LogMixin, HeadlessConnection):
         self.resource_filter_model.deleteLater()
 
 
+def _legacy_filter_settings(url, resource_filter_ids):
+    """Reads filter settings that correspond to legacy resource filter ids from a database.
+
+    Args:
+        url (str): database URL
+        resource_filter_ids (dict): mapping from filter type to filter ids
+
+    Returns:
+        dict: mapping from filter type to filter name to online flag
+    """
+    try:
+        db_map = DatabaseMapping(url)
+    except (SpineDBAPIError, SpineDBVersionError):
+        return {}
+    settings = {}
+    try:
+        for filter_type, subquery in ((SCENARIO_FILTER_TYPE, db_map.scenario_sq), (TOOL_FILTER_TYPE, db_map.tool_sq)):
+            filter_ids = resource_filter_ids.get(filter_type)
+            if filter_ids is None:
+                continue
+            # Legacy ids come from project JSON as lists; match rows against a set to keep the scan linear.
+            filter_ids = set(filter_ids)
+            query = db_map.query(subquery.c.id, subquery.c.name).yield_per(_QUERY_BATCH_SIZE)
+            settings[filter_type] = {name: id_ in filter_ids for id_, name in query}
+    finally:
+        db_map.connection.close()
+    return settings
+
+
 class LoggingJump(LogMixin, Jump):
     def __init__(self, *args, toolbox=None, **kwargs):
         super().__init__(*args, **kwargs)
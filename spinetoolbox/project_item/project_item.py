@@ -328,12 +328,8 @@ class ProjectItem(LogMixin, MetaObject):
         Returns:
             dict: serialized project item
         """
-        return {
-            "type": self.item_type(),
-            "description": self.description,
-            "x": self.get_icon().x(),
-            "y": self.get_icon().y(),
-        }
+        icon = self.get_icon()
+        return {"type": self.item_type(), "description": self.description, "x": icon.x(), "y": icon.y()}
 
     @staticmethod
     def item_dict_local_entries():
@@ -83,6 +83,7 @@ class ProjectItemIcon(QGraphicsPathItem):
         self._name = ""
         self.name_item = QGraphicsSimpleTextItem(self._name)
         self.name_item.setZValue(100)
+        self.name_item.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
         self.set_name_attributes()  # Set font, size, position, etc.
         # Make connector buttons
         self.connectors = dict(
@@ -18,7 +18,6 @@ import shutil
 import os
 import json
 import copy
-from PySide6.QtWidgets import QFileDialog, QMessageBox
 from spine_engine.utils.serialization import serialize_path, deserialize_path
 from .config import LATEST_PROJECT_VERSION, PROJECT_FILENAME
 from .helpers import home_dir
@@ -46,7 +45,10 @@ class ProjectUpgrader:
         Returns:
             dict: Latest version of the project info dictionary
         """
-        v = project_dict["project"]["version"]
+        v = project_dict.get("project", {}).get("version")
+        if v is None:
+            self._toolbox.msg_error.emit("Invalid project.json file. Key 'version' not found.")
+            return False
         if v > LATEST_PROJECT_VERSION:
             # User is trying to load a more recent project than this version of Toolbox can handle
             self._toolbox.msg_warning.emit(
@@ -82,6 +84,7 @@ class ProjectUpgrader:
         """
         # TODO: Fix upgrade_vx_to_vx() methods so they do not depend on self._toolbox.item_factories because these are
         # TODO: going to change
+        original_version = v
         while v < LATEST_PROJECT_VERSION:
             if v == 1:
                 project_dict = self.upgrade_v1_to_v2(project_dict, self._toolbox.item_factories)
@@ -104,7 +107,8 @@ class ProjectUpgrader:
             elif v == 10:
                 project_dict = self.upgrade_v10_to_v11(project_dict)
             v += 1
-            self._toolbox.msg_success.emit(f"Project upgraded to version {v}")
+        if v != original_version:
+            self._toolbox.msg_success.emit(f"Project upgraded from version {original_version} to version {v}")
         return project_dict
 
     @staticmethod
@@ -125,25 +129,23 @@ class ProjectUpgrader:
         Returns:
             dict: Version 2 project dictionary
         """
+        old_project = old["project"]
         new = dict()
         new["version"] = 2
-        new["name"] = old["project"]["name"]
-        new["description"] = old["project"]["description"]
+        new["name"] = old_project["name"]
+        new["description"] = old_project["description"]
         new["specifications"] = dict()
-        new["specifications"]["Tool"] = old["project"]["tool_specifications"]
-        new["connections"] = old["project"]["connections"]
+        new["specifications"]["Tool"] = old_project["tool_specifications"]
+        new["connections"] = old_project["connections"]
         # Change 'objects' to 'items' and remove all 'short name' entries
         # Also stores item_dict under their name and not under category
         items = dict()
-        for category in old["objects"].keys():
-            for item_name in old["objects"][category].keys():
-                old["objects"][category][item_name].pop("short name", "")  # Remove 'short name'
+        for category, category_items in old["objects"].items():
+            for item_name, v1_item_dict in category_items.items():
+                v1_item_dict.pop("short name", "")  # Remove 'short name'
                 # Add type to old item_dict if not there
-                if "type" not in old["objects"][category][item_name]:
-                    old["objects"][category][item_name]["type"] = category[:-1]  # Hackish, but should do the trick
+                item_type = v1_item_dict.setdefault("type", category[:-1])  # Hackish, but should do the trick
                 # Upgrade item_dict to version 2 if needed
-                v1_item_dict = old["objects"][category][item_name]
-                item_type = old["objects"][category][item_name]["type"]
                 if item_type == "Exporter":
                     # Factories don't contain 'Exporter' anymore.
                     item_type = "GdxExporter"
@@ -465,10 +467,7 @@ class ProjectUpgrader:
         """
         new = copy.deepcopy(old)
         new["project"]["version"] = 9
-        try:
-            new["project"].pop("name")
-        except KeyError:
-            pass
+        new["project"].pop("name", None)
         return new
 
     @staticmethod
@@ -535,17 +534,22 @@ class ProjectUpgrader:
         Returns:
             str: Path to project directory or an empty string if operation is canceled.
         """
+        from PySide6.QtWidgets import QFileDialog, QMessageBox  # pylint: disable=import-outside-toplevel
+
         # Ask user for a new directory where to save the project
         answer = QFileDialog.getExistingDirectory(self._toolbox, "Select a project directory", home_dir())
         if not answer:  # Canceled (american-english), cancelled (british-english)
             return ""
-        if not os.path.isdir(answer):  # Check that it's a directory
+        try:
+            with os.scandir(answer) as entries:
+                is_project_dir = any(entry.name == ".spinetoolbox" and entry.is_dir() for entry in entries)
+        except OSError:  # Check that it's a directory
             msg = "Selection is not a directory, please try again"
             # noinspection PyCallByClass, PyArgumentList
             QMessageBox.warning(self._toolbox, "Invalid selection", msg)
             return ""
         # Check if the selected directory is already a project directory and ask if overwrite is ok
-        if os.path.isdir(os.path.join(answer, ".spinetoolbox")):
+        if is_project_dir:
             msg = (
                 "Directory \n\n{0}\n\nalready contains a Spine Toolbox project."
                 "\n\nWould you like to overwrite it?".format(answer)
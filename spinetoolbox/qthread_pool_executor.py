@@ -13,6 +13,7 @@
 Qt-based thread pool executor.
 """
 import os
+from collections import deque
 from PySide6.QtCore import QMutex, QSemaphore, QThread
 
 
@@ -24,7 +25,7 @@ class QtBasedQueue:
     """A Qt-based clone of queue.Queue."""
 
     def __init__(self):
-        self._items = []
+        self._items = deque()
         self._mutex = QMutex()
         self._semafore = QSemaphore()
 
@@ -41,7 +42,7 @@ class QtBasedQueue:
         if not self._semafore.tryAcquire(1, timeout):
             raise TimeOutError()
         self._mutex.lock()
-        item = self._items.pop(0)
+        item = self._items.popleft()
         self._mutex.unlock()
         return item
 
@@ -50,26 +51,36 @@ class QtBasedFuture:
     """A Qt-based clone of concurrent.futures.Future."""
 
     def __init__(self):
-        self._result_queue = QtBasedQueue()
-        self._exception_queue = QtBasedQueue()
+        self._outcome_queue = QtBasedQueue()
+        self._outcome = None
 
     def set_result(self, result):
-        self._exception_queue.put(None)
-        self._result_queue.put(result)
+        self._outcome_queue.put((result, None))
 
     def set_exception(self, exc):
-        self._exception_queue.put(exc)
-        self._result_queue.put(None)
+        self._outcome_queue.put((None, exc))
+
+    def _wait_outcome(self, timeout):
+        """Waits until the result or exception is available and returns both.
+
+        Args:
+            timeout (float, optional): seconds to wait, None to wait indefinitely
+
+        Returns:
+            tuple: result and exception
+        """
+        if self._outcome is None:
+            self._outcome = self._outcome_queue.get(timeout=timeout)
+        return self._outcome
 
     def result(self, timeout=None):
-        result = self._result_queue.get(timeout=timeout)
-        exc = self.exception(timeout=0)
+        result, exc = self._wait_outcome(timeout)
         if exc is not None:
             raise exc
         return result
 
     def exception(self, timeout=None):
-        return self._exception_queue.get(timeout=timeout)
+        return self._wait_outcome(timeout)[1]
 
 
 class QtBasedThread(QThread):
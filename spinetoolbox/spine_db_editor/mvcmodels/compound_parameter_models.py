@@ -593,7 +593,9 @@ class CompoundParameterValueMixin:
         raise NotImplementedError()
 
     def set_filter_entity_ids(self, entity_ids):
-        self._filter_entity_ids = entity_ids
+        if entity_ids == self._filter_entity_ids:
+            return
+        self._filter_entity_ids = entity_ids = dict(entity_ids)
         for model in self.single_models:
             if model.set_filter_entity_ids(entity_ids):
                 self._invalidate_filter()
@@ -361,20 +361,19 @@ class MetadataTableModelBase(QAbstractTableModel):
         """
         id_update_rows = set()
         for db_map, items in db_map_data.items():
-            unique_identifiers = {}
-            for item in items:
-                unique_identifiers.setdefault(item[self._ITEM_NAME_KEY], {})[
-                    item[self._ITEM_VALUE_KEY]
-                ] = self._ids_from_added_item(item)
+            unique_identifiers = {
+                (item[self._ITEM_NAME_KEY], item[self._ITEM_VALUE_KEY]): self._ids_from_added_item(item)
+                for item in items
+            }
             for i, row in enumerate(self._data):
                 if row[Column.DB_MAP] != db_map:
                     continue
-                id_ = unique_identifiers.get(row[Column.NAME], {}).pop(row[Column.VALUE], None)
+                id_ = unique_identifiers.pop((row[Column.NAME], row[Column.VALUE]), None)
                 if id_ is None:
                     continue
                 self._set_extra_columns(row, id_)
                 id_update_rows.add(i)
-            ids_to_insert = {id_ for ids_by_name in unique_identifiers.values() for id_ in ids_by_name.values()}
+            ids_to_insert = set(unique_identifiers.values())
             if ids_to_insert:
                 added = [
                     [i[self._ITEM_NAME_KEY], i[self._ITEM_VALUE_KEY], db_map] + self._extra_cells_from_added_item(i)
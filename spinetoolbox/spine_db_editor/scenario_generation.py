@@ -12,30 +12,23 @@
 """
 Contains functions for automatically generating scenarios from a set of alternatives.
 """
-from itertools import compress, permutations
+from itertools import combinations
 
 
 def all_combinations(alternatives):
     """Creates all possible combinations of alternatives.
 
     Args:
-        alternatives (Iterable of Any): alternatives
+        alternatives (Sequence of Any): alternatives
 
     Returns:
         list of list: lists containing alternatives for each scenario
     """
-    count = len(alternatives)
-    proto_selection = count * [False]
-    scenarios = []
-    for i in range(count):
-        proto_selection[i] = True
-        if i != count - 1:
-            selections = set(permutations(proto_selection, count))
-        else:
-            selections = (proto_selection,)
-        for selection in selections:
-            scenarios.append(list(compress(alternatives, selection)))
-    return scenarios
+    return [
+        list(combination)
+        for size in range(1, len(alternatives) + 1)
+        for combination in combinations(alternatives, size)
+    ]
 
 
 def unique_alternatives(alternatives):
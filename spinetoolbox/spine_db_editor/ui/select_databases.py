@@ -69,8 +69,6 @@ class Ui_Form(object):
 
 
         self.retranslateUi(Form)
-
-        QMetaObject.connectSlotsByName(Form)
     # setupUi
 
     def retranslateUi(self, Form):
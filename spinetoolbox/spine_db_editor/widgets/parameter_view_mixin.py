@@ -40,6 +40,7 @@ class ParameterViewMixin:
         self._filter_entity_ids_in_cls = {}
         self._filter_entity_ids_in_rel = {}
         self._filter_alternative_ids = {}
+        self._applied_filters = None
         self.object_parameter_value_model = CompoundObjectParameterValueModel(self, self.db_mngr)
         self.relationship_parameter_value_model = CompoundRelationshipParameterValueModel(self, self.db_mngr)
         self.object_parameter_definition_model = CompoundObjectParameterDefinitionModel(self, self.db_mngr)
@@ -88,6 +89,7 @@ class ParameterViewMixin:
         self.object_parameter_definition_model.init_model()
         self.relationship_parameter_value_model.init_model()
         self.relationship_parameter_definition_model.init_model()
+        self._applied_filters = None
         self._set_default_parameter_data()
 
     @Slot(QModelIndex, int, object)
@@ -101,16 +103,15 @@ class ParameterViewMixin:
         """
         relationship_class = self.db_mngr.get_item(db_map, "relationship_class", rel_cls_id, only_visible=False)
         object_class_id_list = relationship_class.get("object_class_id_list")
-        object_class_names = []
-        object_names_lists = []
-        for id_ in object_class_id_list:
-            object_class_name = self.db_mngr.get_item(db_map, "object_class", id_, only_visible=False).get("name")
-            object_names_list = [
-                x["name"]
-                for x in self.db_mngr.get_items_by_field(db_map, "object", "class_id", id_, only_visible=False)
-            ]
-            object_class_names.append(object_class_name)
-            object_names_lists.append(object_names_list)
+        object_class_names = [
+            self.db_mngr.get_field(db_map, "object_class", id_, "name") for id_ in object_class_id_list
+        ]
+        object_names_by_class_id = {id_: [] for id_ in object_class_id_list}
+        for x in self.db_mngr.get_items(db_map, "object"):
+            names = object_names_by_class_id.get(x["class_id"])
+            if names is not None:
+                names.append(x["name"])
+        object_names_lists = [list(object_names_by_class_id[id_]) for id_ in object_class_id_list]
         object_name_list = index.data(Qt.ItemDataRole.EditRole)
         try:
             current_object_names = object_name_list.split(DB_ITEM_SEPARATOR)
@@ -152,7 +153,14 @@ class ParameterViewMixin:
         self._reset_filters()
 
     def _reset_filters(self):
-        """Resets filters."""
+        """Resets filters unless they are the same as the ones applied last time."""
+        filters = tuple(
+            {key: frozenset(ids) for key, ids in filter_ids.items()}
+            for filter_ids in (self._filter_class_ids, self._filter_entity_ids, self._filter_alternative_ids)
+        )
+        if filters == self._applied_filters:
+            return
+        self._applied_filters = filters
         for model in self._parameter_models:
             model.set_filter_class_ids(self._filter_class_ids)
         for model in self._parameter_value_models:
@@ -164,24 +172,40 @@ class ParameterViewMixin:
         """Resets filter according to graph selection."""
         obj_items = selected_items["object"]
         rel_items = selected_items["relationship"]
+        filter_class_ids = {}
+        filter_entity_ids = {}
+
+        def add_to_filters(db_map_items):
+            """Collects class and entity ids from given items into the filters in a single pass.
+
+            Returns:
+                dict: mapping from db map to set of entity ids
+            """
+            db_map_ids = {}
+            for db_map, items in db_map_items.items():
+                class_ids = filter_class_ids.setdefault(db_map, set())
+                ids = db_map_ids[db_map] = set()
+                for item in items:
+                    class_id = item["class_id"]
+                    id_ = item["id"]
+                    class_ids.add(class_id)
+                    ids.add(id_)
+                    filter_entity_ids.setdefault((db_map, class_id), set()).add(id_)
+            return db_map_ids
+
         active_objs = {}
         for x in obj_items:
             for db_map in x.db_maps:
                 active_objs.setdefault(db_map, []).append(x.db_representation(db_map))
-        cascading_rels = self.db_mngr.find_cascading_relationships(self.db_mngr.db_map_ids(active_objs))
+        cascading_rels = self.db_mngr.find_cascading_relationships(add_to_filters(active_objs))
         active_rels = {}
         for x in rel_items:
             for db_map in x.db_maps:
                 active_rels.setdefault(db_map, []).append(x.db_representation(db_map))
-        for db_map, rels in cascading_rels.items():
-            active_rels.setdefault(db_map, []).extend(rels)
-        self._filter_class_ids = {}
-        for db_map, items in active_objs.items():
-            self._filter_class_ids.setdefault(db_map, set()).update({x["class_id"] for x in items})
-        for db_map, items in active_rels.items():
-            self._filter_class_ids.setdefault(db_map, set()).update({x["class_id"] for x in items})
-        self._filter_entity_ids = self.db_mngr.db_map_class_ids(active_objs)
-        self._filter_entity_ids.update(self.db_mngr.db_map_class_ids(active_rels))
+        add_to_filters(active_rels)
+        add_to_filters(cascading_rels)
+        self._filter_class_ids = filter_class_ids
+        self._filter_entity_ids = filter_entity_ids
         self._reset_filters()
 
     def _handle_object_tree_selection_changed(self, selected_indexes):
@@ -190,15 +214,27 @@ class ParameterViewMixin:
         obj_inds = set(selected_indexes.get("object", {}).keys())
         rel_cls_inds = set(selected_indexes.get("relationship_class", {}).keys())
         active_rel_inds = set(selected_indexes.get("relationship", {}).keys())
+        parents = {}
+
+        def parents_of(indexes):
+            parent_set = set()
+            for ind in indexes:
+                parent = parents.get(ind)
+                if parent is None:
+                    parent = parents[ind] = ind.parent()
+                parent_set.add(parent)
+            return parent_set
+
         # Compute active indexes by merging in the parents from lower levels recursively
-        active_rel_cls_inds = rel_cls_inds | {ind.parent() for ind in active_rel_inds}
-        active_obj_inds = obj_inds | {ind.parent() for ind in active_rel_cls_inds}
-        active_obj_cls_inds = obj_cls_inds | {ind.parent() for ind in active_obj_inds}
-        filter_class_ids = self._db_map_ids(active_obj_cls_inds | active_rel_cls_inds)
-        filter_entity_ids = self._db_map_class_ids(active_obj_inds | active_rel_inds)
+        active_rel_cls_inds = rel_cls_inds | parents_of(active_rel_inds)
+        active_obj_inds = obj_inds | parents_of(active_rel_cls_inds)
+        active_obj_cls_inds = obj_cls_inds | parents_of(active_obj_inds)
+        db_map_data = {}
+        filter_class_ids = self._db_map_ids(active_obj_cls_inds | active_rel_cls_inds, db_map_data)
+        filter_entity_ids = self._db_map_class_ids(active_obj_inds | active_rel_inds, db_map_data)
         # Cascade (note that we carefully select where to cascade from, to avoid 'circularity')
-        obj_cls_ids = self._db_map_ids(obj_cls_inds | {ind.parent() for ind in obj_inds})
-        obj_ids = self._db_map_ids(obj_inds | {ind.parent() for ind in rel_cls_inds})
+        obj_cls_ids = self._db_map_ids(obj_cls_inds | parents_of(obj_inds), db_map_data)
+        obj_ids = self._db_map_ids(obj_inds | parents_of(rel_cls_inds), db_map_data)
         cascading_rel_clss = self.db_mngr.find_cascading_relationship_classes(obj_cls_ids, only_visible=False)
         cascading_rels = self.db_mngr.find_cascading_relationships(obj_ids, only_visible=False)
         for db_map, ids in self.db_mngr.db_map_ids(cascading_rel_clss).items():
@@ -230,7 +266,7 @@ class ParameterViewMixin:
             else:
                 self._filter_class_ids_in_cls = {}
                 self._filter_entity_ids_in_cls = {}
-            self._filter_alternative_ids.clear()
+            self._filter_alternative_ids = {}
         if object_tree:
             self._filter_class_ids_in_cls, self._filter_entity_ids_in_cls = self._handle_object_tree_selection_changed(
                 selected_indexes
@@ -270,17 +306,15 @@ class ParameterViewMixin:
             other_tree_view (AlternativeTreeView or ScenarioTreeView): tree view whose selection didn't change
             this_tree_view (AlternativeTreeView or ScenarioTreeView): tree view whose selection changed
         """
+        # The tree views update their selection sets in place, so filters must hold copies.
+        alternative_ids = {db_map: set(alt_ids) for db_map, alt_ids in selected_db_map_alt_ids.items()}
         if Qt.KeyboardModifier.ControlModifier in QGuiApplication.keyboardModifiers():
-            alternative_ids = {
-                db_map: alt_ids.copy() for db_map, alt_ids in other_tree_view.selected_alternative_ids.items()
-            }
+            for db_map, alt_ids in other_tree_view.selected_alternative_ids.items():
+                alternative_ids.setdefault(db_map, set()).update(alt_ids)
         else:
-            alternative_ids = {}
             self._clear_all_other_selections(this_tree_view)
-            self._filter_class_ids.clear()
-            self._filter_entity_ids.clear()
-        for db_map, alt_ids in selected_db_map_alt_ids.items():
-            alternative_ids.setdefault(db_map, set()).update(alt_ids)
+            self._filter_class_ids = {}
+            self._filter_entity_ids = {}
         self._filter_alternative_ids = alternative_ids
         self._reset_filters()
 
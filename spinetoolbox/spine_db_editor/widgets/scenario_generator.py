@@ -45,6 +45,7 @@ class ScenarioGenerator(QWidget):
 
         self._db_map = db_map
         self._alternatives = alternatives
+        self._alternatives_by_name = {a["name"]: a for a in alternatives}
         self._db_editor = spine_db_editor
         super().__init__(parent)
         self.setWindowFlag(Qt.WindowType.Window, True)
@@ -60,7 +61,7 @@ class ScenarioGenerator(QWidget):
         self._ui.button_box.accepted.connect(self._ui.accept_action.trigger)
         self._ui.button_box.rejected.connect(self._ui.reject_action.trigger)
         self._ui.operation_combo_box.addItems(self._TYPE_LABELS)
-        alternative_names = [item["name"] for item in alternatives]
+        alternative_names = list(self._alternatives_by_name)
         self._ui.base_alternative_combo_box.addItems(sorted(alternative_names))
         self._ui.use_base_alternative_check_box.stateChanged.connect(self._enable_base_alternative)
         self._ui.base_alternative_combo_box.setCurrentText(_find_base_alternative(alternative_names))
@@ -78,8 +79,9 @@ class ScenarioGenerator(QWidget):
             return
         operation_label = self._ui.operation_combo_box.currentText()
         alternative_list = self._ui.alternative_list
-        alternative_order = {alternative_list.item(row).text(): row for row in range(alternative_list.count())}
-        alternatives = sorted(self._alternatives, key=lambda a: alternative_order[a["name"]])
+        alternatives = [
+            self._alternatives_by_name[alternative_list.item(row).text()] for row in range(alternative_list.count())
+        ]
         scenario_alternatives = {self._TYPE_LABELS[0]: all_combinations, self._TYPE_LABELS[1]: unique_alternatives}[
             operation_label
         ](alternatives)
@@ -87,9 +89,10 @@ class ScenarioGenerator(QWidget):
             self._insert_base_alternative(scenario_alternatives)
             if operation_label == self._TYPE_LABELS[0]:
                 _ensure_unique(scenario_alternatives)
-        suffix = _suffix(len(scenario_alternatives))
+        scenario_count = len(scenario_alternatives)
+        digit_count = len(str(scenario_count))
         generated_scenario_names = [
-            scenario_prefix + suffix.format(count) for count in range(1, len(scenario_alternatives) + 1)
+            f"{scenario_prefix}{count:0{digit_count}}" for count in range(1, scenario_count + 1)
         ]
         scenario_items = self._db_editor.db_mngr.get_items(self._db_map, "scenario", only_visible=False)
         existing_scenario_names = {item.name for item in scenario_items}
@@ -105,16 +108,22 @@ class ScenarioGenerator(QWidget):
                 scenarios_to_modify = generated_scenario_names
             else:
                 scenarios_to_modify = new_scenarios
-        self._generate_scenarios(new_scenarios, scenarios_to_modify, scenario_alternatives)
+                scenario_alternatives = [
+                    scenario_alts
+                    for name, scenario_alts in zip(generated_scenario_names, scenario_alternatives)
+                    if name not in existing_scenario_names
+                ]
+        self._generate_scenarios(new_scenarios, scenarios_to_modify, scenario_alternatives, scenario_items)
         self.close()
 
-    def _generate_scenarios(self, new_scenarios, scenarios_to_modify, scenario_alternatives):
+    def _generate_scenarios(self, new_scenarios, scenarios_to_modify, scenario_alternatives, scenario_items):
         """Generates scenarios with all possible combinations of given alternatives.
 
         Args:
             new_scenarios (Iterable of str): names of new scenarios to create
             scenarios_to_modify (Iterable of str): names of scenarios to modify
-            scenario_alternatives (list of list): alternative items for each scenario
+            scenario_alternatives (list of list): alternative items for each scenario in scenarios_to_modify
+            scenario_items (list of CacheItem): scenarios that exist in the database before generation
         """
         if new_scenarios:
             with signal_waiter(
@@ -122,18 +131,17 @@ class ScenarioGenerator(QWidget):
             ) as waiter:
                 self._db_editor.db_mngr.add_scenarios({self._db_map: [{"name": name} for name in new_scenarios]})
                 waiter.wait()
-        searchable_scenario_names = set(scenarios_to_modify)
-        scenario_definitions_by_id = dict()
-        alternative_iter = iter(scenario_alternatives)
-        scenario_items = self._db_editor.db_mngr.get_items(self._db_map, "scenario", only_visible=False)
-        for item in scenario_items:
-            if item.name not in searchable_scenario_names:
+            # All scenarios have been fetched already, so reading the cache is enough.
+            scenario_items = self._db_editor.db_mngr.get_items(self._db_map, "scenario")
+        scenario_ids = {item.name: item.id for item in scenario_items}
+        scenario_alternative_data = []
+        for name, alternatives in zip(scenarios_to_modify, scenario_alternatives):
+            scenario_id = scenario_ids.get(name)
+            if scenario_id is None:
                 continue
-            scenario_definitions_by_id[item.id] = [a["id"] for a in next(alternative_iter)]
-        scenario_alternative_data = [
-            {"id": scenario_id, "alternative_id_list": alternative_ids}
-            for scenario_id, alternative_ids in scenario_definitions_by_id.items()
-        ]
+            scenario_alternative_data.append(
+                {"id": scenario_id, "alternative_id_list": [a["id"] for a in alternatives]}
+            )
         self._db_editor.db_mngr.set_scenario_alternatives({self._db_map: scenario_alternative_data})
 
     def _check_existing_scenarios(self, proposed_scenario_names, existing_scenario_names):
@@ -146,7 +154,7 @@ class ScenarioGenerator(QWidget):
         Returns:
              _ScenarioNameResolution: action to take
         """
-        if all(name not in existing_scenario_names for name in proposed_scenario_names):
+        if existing_scenario_names.isdisjoint(proposed_scenario_names):
             return _ScenarioNameResolution.NO_CONFLICT
         message_box = QMessageBox(
             QMessageBox.Icon.Warning,
@@ -186,7 +194,7 @@ class ScenarioGenerator(QWidget):
         base_name = self._ui.base_alternative_combo_box.currentText()
         if not base_name:
             return
-        base = next(iter(a for a in self._alternatives if a["name"] == base_name))
+        base = self._alternatives_by_name[base_name]
         for alternatives in scenario_alternatives:
             try:
                 existing_index = [a["name"] for a in alternatives].index(base_name)
@@ -235,15 +243,3 @@ def _find_base_alternative(names):
     else:
         return names[base_index]
 
-
-def _suffix(item_count):
-    """Returns a formattable string with enough zero padding to hold item_count digits.
-
-    Args:
-        item_count (int): maximum number of items
-
-    Returns:
-        str: string in the form '{:0n}' where n is the number of digits in item_count
-    """
-    digit_count = len(str(item_count))
-    return f"{{:0{digit_count}}}"
@@ -95,24 +95,34 @@ class TreeViewMixin:
                 view.expand(index)
 
     @staticmethod
-    def _db_map_items(indexes):
+    def _db_map_items(indexes, cache=None):
         """Groups items from given tree indexes by db map.
 
+        Args:
+            indexes (Iterable of QModelIndex): tree indexes
+            cache (dict, optional): mapping from index to its (db_map, item) pairs;
+                reused and updated across calls that share the same indexes
+
         Returns:
             dict: lists of dictionary items keyed by DiffDatabaseMapping
         """
+        if cache is None:
+            cache = {}
         d = dict()
         for index in indexes:
-            item = index.model().item_from_index(index)
-            for db_map in item.db_maps:
-                d.setdefault(db_map, []).append(item.db_map_data(db_map))
+            db_map_data = cache.get(index)
+            if db_map_data is None:
+                item = index.model().item_from_index(index)
+                db_map_data = cache[index] = [(db_map, item.db_map_data(db_map)) for db_map in item.db_maps]
+            for db_map, data in db_map_data:
+                d.setdefault(db_map, []).append(data)
         return d
 
-    def _db_map_ids(self, indexes):
-        return self.db_mngr.db_map_ids(self._db_map_items(indexes))
+    def _db_map_ids(self, indexes, cache=None):
+        return self.db_mngr.db_map_ids(self._db_map_items(indexes, cache))
 
-    def _db_map_class_ids(self, indexes):
-        return self.db_mngr.db_map_class_ids(self._db_map_items(indexes))
+    def _db_map_class_ids(self, indexes, cache=None):
+        return self.db_mngr.db_map_class_ids(self._db_map_items(indexes, cache))
 
     def export_selected(self, selected_indexes):
         """Exports data from given indexes in the entity tree."""
@@ -13,11 +13,13 @@
 The SpineDBManager class
 """
 
+from itertools import chain
 import json
 import os
 from PySide6.QtCore import Qt, QObject, Signal, Slot, QRecursiveMutex
 from PySide6.QtWidgets import QMessageBox, QWidget
 from PySide6.QtGui import QFontMetrics, QFont, QWindow
+from sqlalchemy import text
 from sqlalchemy.engine.url import URL
 from spinedb_api import (
     is_empty,
@@ -208,8 +210,8 @@ class SpineDBManager(QObject):
         if item_type in ("object_class", "relationship_class"):
             self.update_icons(db_map_data)
         for db_map, items in db_map_data.items():
-            table_cache = db_map.cache.table_cache(item_type)
-            new_db_map_data[db_map] = [table_cache.add_item(item, keep_existing=True) for item in items]
+            add_item = db_map.cache.table_cache(item_type).add_item
+            new_db_map_data[db_map] = [add_item(item, keep_existing=True) for item in items]
         return new_db_map_data
 
     def update_items_in_cache(self, item_type, db_map_data):
@@ -225,8 +227,9 @@ class SpineDBManager(QObject):
             table_cache = db_map.cache.get(item_type)
             if table_cache is None:
                 continue
+            update_item = table_cache.update_item
             for item in items:
-                table_cache.update_item(item)
+                update_item(item)
 
     @staticmethod
     def remove_items_in_cache(item_type, db_map_ids):
@@ -244,7 +247,9 @@ class SpineDBManager(QObject):
             table_cache = db_map.cache.get(item_type)
             if table_cache is None:
                 continue
-            db_map_data[db_map] = sum((table_cache.remove_item(id_) for id_ in ids), [])
+            removed_items = db_map_data[db_map] = []
+            for id_ in ids:
+                removed_items.extend(table_cache.remove_item(id_))
         return db_map_data
 
     @busy_effect
@@ -1014,7 +1019,7 @@ class SpineDBManager(QObject):
 
     def _import_data_cmds(self, db_map, data_for_import, db_map_error_log):
         for item_type, (to_add, to_update, import_error_log) in data_for_import:
-            db_map_error_log.setdefault(db_map, []).extend([str(x) for x in import_error_log])
+            db_map_error_log.setdefault(db_map, []).extend(import_error_log)
             if to_update:
                 yield UpdateItemsCommand(self, db_map, to_update, item_type, check=False)
             if to_add:
@@ -1575,15 +1580,15 @@ class SpineDBManager(QObject):
         self.import_data({db_map: data for db_map in db_maps}, command_text="Duplicate object")
 
     def _get_data_for_export(self, db_map_item_ids):
-        data = {}
+        item_lists = {}
         for db_map, item_ids in db_map_item_ids.items():
             make_cache = lambda tablenames, db_map=db_map, **kwargs: self.get_db_map_cache(
                 db_map, fetch_item_types=tablenames, **kwargs
             )
 
             for key, items in export_data(db_map, make_cache=make_cache, parse_value=load_db_value, **item_ids).items():
-                data.setdefault(key, []).extend(items)
-        return data
+                item_lists.setdefault(key, []).append(items)
+        return {key: list(chain.from_iterable(lists)) for key, lists in item_lists.items()}
 
     def export_data(self, caller, db_map_item_ids, file_path, file_filter):
         data = self._get_data_for_export(db_map_item_ids)
@@ -1610,6 +1615,8 @@ class SpineDBManager(QObject):
             return
         create_new_spine_database(url)
         db_map = DatabaseMapping(url)
+        # The file is freshly created just for the export, so there is nothing to lose by not syncing to disk.
+        db_map.connection.execute(text("PRAGMA synchronous = OFF"))
         import_data(db_map, **data_for_export)
         try:
             db_map.commit_session("Export data from Spine Toolbox.")
@@ -1623,9 +1630,8 @@ class SpineDBManager(QObject):
 
     def export_to_json(self, file_path, data_for_export, caller):  # pylint: disable=no-self-use
         """Exports given data into JSON file."""
-        json_data = json.dumps(data_for_export, indent=4)
         with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(json_data)
+            json.dump(data_for_export, f, indent=4)
         caller.file_exported.emit(file_path)
 
     def export_to_excel(self, file_path, data_for_export, caller):  # pylint: disable=no-self-use
@@ -1635,8 +1641,11 @@ class SpineDBManager(QObject):
         db_map = DatabaseMapping(url, create=True)
         import_data(db_map, **data_for_export)
         file_name = os.path.split(file_path)[1]
-        if os.path.exists(file_path):
+        try:
             os.remove(file_path)
+        except OSError:
+            # Either there is nothing to remove or the exporter below reports why the file cannot be written.
+            pass
         try:
             export_spine_database_to_xlsx(db_map, file_path)
         except PermissionError:
@@ -388,8 +388,11 @@ class SpineDBWorker(QObject):
             return
         if item_type == "entity_group":  # FIXME: the entity_group table has no commit_id column :(
             return
+        ids_by_commit_id = {}
         for item in items:
-            self.commit_cache.setdefault(item["commit_id"], {}).setdefault(item_type, list()).append(item["id"])
+            ids_by_commit_id.setdefault(item["commit_id"], []).append(item["id"])
+        for commit_id, ids in ids_by_commit_id.items():
+            self.commit_cache.setdefault(commit_id, {}).setdefault(item_type, list()).extend(ids)
 
     def close_db_map(self):
         _ = self._executor.submit(self._close_db_map).result()
@@ -459,6 +462,7 @@ class SpineDBWorker(QObject):
             if callback is not None:
                 callback({})
             return
+        db_map_data_by_type = {}
         for actual_item_type, actual_items in self._split_items_by_type(item_type, items):
             if not readd:
                 actual_items = self._db_mngr.add_items_to_cache(actual_item_type, {self._db_map: actual_items})[
@@ -486,9 +490,12 @@ class SpineDBWorker(QObject):
             db_map_data = {self._db_map: data}
             if item_type == actual_item_type and callback is not None:
                 callback(db_map_data)
-            if items:
-                self._db_mngr.items_added.emit(actual_item_type, db_map_data)
-                return True
+            db_map_data_by_type[actual_item_type] = db_map_data
+        if not items:
+            return False
+        for actual_item_type, db_map_data in db_map_data_by_type.items():
+            self._db_mngr.items_added.emit(actual_item_type, db_map_data)
+        return True
 
     def _rebind_recursively(self, item):
         """Rebinds a cache item and its referrers to fetch parents.
@@ -144,8 +144,6 @@ class Ui_Form(object):
         self.pushButton_ok.setDefault(True)
         self.pushButton_cancel.setDefault(True)
 
-
-        QMetaObject.connectSlotsByName(Form)
     # setupUi
 
     def retranslateUi(self, Form):
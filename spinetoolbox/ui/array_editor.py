@@ -127,8 +127,6 @@ class Ui_Form(object):
 
         self.plot_widget_stack.setCurrentIndex(1)
 
-
-        QMetaObject.connectSlotsByName(Form)
     # setupUi
 
     def retranslateUi(self, Form):
@@ -63,8 +63,6 @@ class Ui_DatetimeEditor(object):
 
 
         self.retranslateUi(DatetimeEditor)
-
-        QMetaObject.connectSlotsByName(DatetimeEditor)
     # setupUi
 
     def retranslateUi(self, DatetimeEditor):
@@ -62,8 +62,6 @@ class Ui_DurationEditor(object):
 
 
         self.retranslateUi(DurationEditor)
-
-        QMetaObject.connectSlotsByName(DurationEditor)
     # setupUi
 
     def retranslateUi(self, DurationEditor):
@@ -42,8 +42,6 @@ class Ui_ImportSourceSelector(object):
 
 
         self.retranslateUi(ImportSourceSelector)
-
-        QMetaObject.connectSlotsByName(ImportSourceSelector)
     # setupUi
 
     def retranslateUi(self, ImportSourceSelector):
@@ -236,9 +236,6 @@ class Ui_MainWindow(object):
         self.verticalLayout_5.setSpacing(0)
         self.verticalLayout_5.setObjectName(u"verticalLayout_5")
         self.verticalLayout_5.setContentsMargins(0, 0, 0, 0)
-        self.verticalLayout_7 = QVBoxLayout()
-        self.verticalLayout_7.setSpacing(0)
-        self.verticalLayout_7.setObjectName(u"verticalLayout_7")
         self.textBrowser_eventlog = CustomQTextBrowser(self.dockWidgetContents)
         self.textBrowser_eventlog.setObjectName(u"textBrowser_eventlog")
         sizePolicy.setHeightForWidth(self.textBrowser_eventlog.sizePolicy().hasHeightForWidth())
@@ -246,7 +243,7 @@ class Ui_MainWindow(object):
         self.textBrowser_eventlog.setContextMenuPolicy(Qt.DefaultContextMenu)
         self.textBrowser_eventlog.setOpenLinks(False)
 
-        self.verticalLayout_7.addWidget(self.textBrowser_eventlog)
+        self.verticalLayout_5.addWidget(self.textBrowser_eventlog)
 
         self.toolButton_executions = QToolButton(self.dockWidgetContents)
         self.toolButton_executions.setObjectName(u"toolButton_executions")
@@ -256,10 +253,7 @@ class Ui_MainWindow(object):
         self.toolButton_executions.setPopupMode(QToolButton.InstantPopup)
         self.toolButton_executions.setToolButtonStyle(Qt.ToolButtonTextBesideIcon)
 
-        self.verticalLayout_7.addWidget(self.toolButton_executions)
-
-
-        self.verticalLayout_5.addLayout(self.verticalLayout_7)
+        self.verticalLayout_5.addWidget(self.toolButton_executions)
 
         self.dockWidget_eventlog.setWidget(self.dockWidgetContents)
         MainWindow.addDockWidget(Qt.BottomDockWidgetArea, self.dockWidget_eventlog)
@@ -371,7 +365,7 @@ class Ui_MainWindow(object):
         self.graphicsView.setRenderHints(QPainter.Antialiasing|QPainter.TextAntialiasing)
         self.graphicsView.setDragMode(QGraphicsView.ScrollHandDrag)
         self.graphicsView.setResizeAnchor(QGraphicsView.AnchorUnderMouse)
-        self.graphicsView.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+        self.graphicsView.setViewportUpdateMode(QGraphicsView.SmartViewportUpdate)
         self.graphicsView.setRubberBandSelectionMode(Qt.ContainsItemBoundingRect)
 
         self.verticalLayout_2.addWidget(self.graphicsView)
@@ -427,8 +421,6 @@ class Ui_MainWindow(object):
 
         self.tabWidget_item_properties.setCurrentIndex(0)
 
-
-        QMetaObject.connectSlotsByName(MainWindow)
     # setupUi
 
     def retranslateUi(self, MainWindow):
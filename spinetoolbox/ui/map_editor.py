@@ -58,8 +58,6 @@ class Ui_MapEditor(object):
 
 
         self.retranslateUi(MapEditor)
-
-        QMetaObject.connectSlotsByName(MapEditor)
     # setupUi
 
     def retranslateUi(self, MapEditor):
@@ -164,8 +164,6 @@ class Ui_Dialog(object):
 
         self.stackedWidget.setCurrentIndex(0)
 
-
-        QMetaObject.connectSlotsByName(Dialog)
     # setupUi
 
     def retranslateUi(self, Dialog):
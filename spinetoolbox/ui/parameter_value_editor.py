@@ -76,8 +76,6 @@ class Ui_ParameterValueEditor(object):
 
         self.editor_stack.setCurrentIndex(-1)
 
-
-        QMetaObject.connectSlotsByName(ParameterValueEditor)
     # setupUi
 
     def retranslateUi(self, ParameterValueEditor):
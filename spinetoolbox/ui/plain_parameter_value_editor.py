@@ -88,8 +88,6 @@ class Ui_PlainParameterValueEditor(object):
 
 
         self.retranslateUi(PlainParameterValueEditor)
-
-        QMetaObject.connectSlotsByName(PlainParameterValueEditor)
     # setupUi
 
     def retranslateUi(self, PlainParameterValueEditor):
@@ -57,8 +57,6 @@ class Ui_Dialog(object):
         self.retranslateUi(Dialog)
         self.button_box.accepted.connect(Dialog.accept)
         self.button_box.rejected.connect(Dialog.reject)
-
-        QMetaObject.connectSlotsByName(Dialog)
     # setupUi
 
     def retranslateUi(self, Dialog):
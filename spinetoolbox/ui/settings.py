@@ -969,8 +969,6 @@ class Ui_SettingsForm(object):
         self.listWidget.setCurrentRow(-1)
         self.stackedWidget.setCurrentIndex(0)
 
-
-        QMetaObject.connectSlotsByName(SettingsForm)
     # setupUi
 
     def retranslateUi(self, SettingsForm):
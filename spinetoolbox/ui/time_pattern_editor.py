@@ -51,8 +51,6 @@ class Ui_TimePatternEditor(object):
 
 
         self.retranslateUi(TimePatternEditor)
-
-        QMetaObject.connectSlotsByName(TimePatternEditor)
     # setupUi
 
     def retranslateUi(self, TimePatternEditor):
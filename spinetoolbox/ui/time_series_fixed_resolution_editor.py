@@ -138,8 +138,6 @@ class Ui_TimeSeriesFixedResolutionEditor(object):
 
 
         self.retranslateUi(TimeSeriesFixedResolutionEditor)
-
-        QMetaObject.connectSlotsByName(TimeSeriesFixedResolutionEditor)
     # setupUi
 
     def retranslateUi(self, TimeSeriesFixedResolutionEditor):
@@ -82,8 +82,6 @@ class Ui_TimeSeriesVariableResolutionEditor(object):
 
 
         self.retranslateUi(TimeSeriesVariableResolutionEditor)
-
-        QMetaObject.connectSlotsByName(TimeSeriesVariableResolutionEditor)
     # setupUi
 
     def retranslateUi(self, TimeSeriesVariableResolutionEditor):
@@ -91,8 +91,6 @@ class Ui_PackagesForm(object):
 
 
         self.retranslateUi(PackagesForm)
-
-        QMetaObject.connectSlotsByName(PackagesForm)
     # setupUi
 
     def retranslateUi(self, PackagesForm):
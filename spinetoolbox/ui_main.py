@@ -214,7 +214,6 @@ class ToolboxUI(QMainWindow):
         self.parse_project_item_modules()
         self.init_project_item_model()
         self.init_specification_model()
-        self.make_item_properties_uis()
         self.main_toolbar.setup()
         self.link_properties_widgets = {
             LoggingConnection: LinkPropertiesWidget(self, base_color=LINK_COLOR),
@@ -783,17 +782,30 @@ class ToolboxUI(QMainWindow):
             model = self.filtered_spec_factory_models[item_type] = FilteredSpecificationModel(item_type)
             model.setSourceModel(self.specification_model)
 
-    def make_item_properties_uis(self):
-        for item_type, factory in self.item_factories.items():
-            properties_ui = self._item_properties_uis[item_type] = factory.make_properties_widget(self)
-            color = factory.icon_color()
-            icon = factory.icon()
-            properties_ui.set_color_and_icon(color, icon)
-            scroll_area = QScrollArea(self)
-            scroll_area.setWidget(properties_ui)
-            scroll_area.setWidgetResizable(True)
-            tab = self._make_properties_tab(scroll_area)
-            self.ui.tabWidget_item_properties.addTab(tab, item_type)
+    def _item_properties_ui(self, item_type):
+        """Returns properties widget for given item type.
+
+        The widget and its properties tab are created on first request
+        so that item types absent from the project cost nothing at startup.
+
+        Args:
+            item_type (str): project item's type
+
+        Returns:
+            PropertiesWidgetBase: item's properties widget
+        """
+        properties_ui = self._item_properties_uis.get(item_type)
+        if properties_ui is not None:
+            return properties_ui
+        factory = self.item_factories[item_type]
+        properties_ui = self._item_properties_uis[item_type] = factory.make_properties_widget(self)
+        properties_ui.set_color_and_icon(factory.icon_color(), factory.icon())
+        scroll_area = QScrollArea(self)
+        scroll_area.setWidget(properties_ui)
+        scroll_area.setWidgetResizable(True)
+        tab = self._make_properties_tab(scroll_area)
+        self.ui.tabWidget_item_properties.addTab(tab, item_type)
+        return properties_ui
 
     def _make_properties_tab(self, properties_ui):
         tab = QWidget(self)
@@ -985,11 +997,11 @@ class ToolboxUI(QMainWindow):
                 self.msg_error.emit(
                     "Something went wrong in disconnecting {0} signals".format(self.active_project_item.name)
                 )
-            self._item_properties_uis[self.active_project_item.item_type()].unset_item()
+            self._item_properties_ui(self.active_project_item.item_type()).unset_item()
         self.active_project_item = active_project_item
         if self.active_project_item:
             self.active_project_item.activate()
-            self._item_properties_uis[self.active_project_item.item_type()].set_item(self.active_project_item)
+            self._item_properties_ui(self.active_project_item.item_type()).set_item(self.active_project_item)
 
     def _set_active_link_item(self, active_link_item):
         """
@@ -1024,7 +1036,7 @@ class ToolboxUI(QMainWindow):
         self.ui.tabWidget_item_properties.currentWidget().layout().insertWidget(0, self._properties_title)
         # Set QDockWidget title to selected item's type
         self.ui.dockWidget_item.setWindowTitle(self.active_project_item.item_type() + " Properties")
-        color = self._item_properties_uis[self.active_project_item.item_type()].fg_color
+        color = self._item_properties_ui(self.active_project_item.item_type()).fg_color
         ss = f"QWidget{{background: {color.name()};}}"
         self._properties_title.setStyleSheet(ss)
         self._button_item_dir.show()
@@ -1051,7 +1063,7 @@ class ToolboxUI(QMainWindow):
 
     def _get_active_properties_widget(self):
         if self.active_project_item is not None:
-            return self._item_properties_uis[self.active_project_item.item_type()]
+            return self._item_properties_ui(self.active_project_item.item_type())
         if self.active_link_item is not None:
             return self.link_properties_widgets[type(self.active_link_item)]
         return None
@@ -2240,7 +2252,7 @@ class ToolboxUI(QMainWindow):
         Returns:
             QWidget: item's properties tab widget
         """
-        return self._item_properties_uis[item_type].ui
+        return self._item_properties_ui(item_type).ui
 
     def project_item_icon(self, item_type):
         return self.item_factories[item_type].make_icon(self)
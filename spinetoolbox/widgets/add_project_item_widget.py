@@ -84,9 +84,7 @@ class AddProjectItemWidget(QWidget):
         if name == "":
             self.ui.label_folder.setText(default)
         else:
-            folder_name = name.lower().replace(" ", "_")
-            msg = default + " " + folder_name
-            self.ui.label_folder.setText(msg)
+            self.ui.label_folder.setText(f"{default} {shorten(name)}")
 
     @Slot()
     def handle_ok_clicked(self):
@@ -772,11 +772,25 @@ class ResizingViewMixin:
         self._resizing_timer = QTimer()
         self._resizing_timer.setSingleShot(True)
         self._resizing_timer.setInterval(20)
-        self._resizing_timer.timeout.connect(self._do_resize)
+        self._resizing_timer.timeout.connect(self._resize_if_visible)
+        self._resize_pending = False
 
     def rowsInserted(self, parent, start, end):
         super().rowsInserted(parent, start, end)
         self._resizing_timer.start()
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._resize_pending:
+            self._resizing_timer.start()
+
+    def _resize_if_visible(self):
+        """Resizes the view now if it is visible, otherwise postpones resizing until the view is shown."""
+        if not self.isVisible():
+            self._resize_pending = True
+            return
+        self._resize_pending = False
+        self._do_resize()
+
     def _do_resize(self):
         raise NotImplementedError()
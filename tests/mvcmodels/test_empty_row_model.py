@@ -0,0 +1,83 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# This file is part of Spine Toolbox.
+# Spine Toolbox is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""
+Unit tests for the EmptyRowModel class.
+"""
+
+import unittest
+from unittest import mock
+from PySide6.QtCore import QModelIndex
+from PySide6.QtWidgets import QApplication
+from spinetoolbox.mvcmodels.empty_row_model import EmptyRowModel
+
+
+class TestEmptyRowModel(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if not QApplication.instance():
+            QApplication()
+
+    def setUp(self):
+        self._model = EmptyRowModel(header=["name", "description"])
+        self._model.set_default_row(name="default name")
+        self._model.fetchMore(QModelIndex())
+
+    def tearDown(self):
+        self._model.deleteLater()
+
+    def test_set_rows_to_default_sets_default_data(self):
+        self.assertEqual(self._model.rowCount(), 1)
+        self.assertEqual(self._model.index(0, 0).data(), "default name")
+        self.assertIsNone(self._model.index(0, 1).data())
+
+    def test_set_rows_to_default_does_not_emit_data_changed_when_row_is_already_default(self):
+        listener = mock.MagicMock()
+        self._model.dataChanged.connect(listener)
+        self._model.set_rows_to_default(0)
+        listener.assert_not_called()
+        self._model.set_default_row(name="other name")
+        self._model.set_rows_to_default(0)
+        listener.assert_called_once()
+        self.assertEqual(self._model.index(0, 0).data(), "other name")
+
+    def test_editing_last_row_appends_empty_row_with_default_data(self):
+        self.assertTrue(self._model.setData(self._model.index(0, 1), "my description"))
+        self.assertEqual(self._model.rowCount(), 2)
+        self.assertEqual(self._row_data(0), ["default name", "my description"])
+        self.assertEqual(self._row_data(1), ["default name", None])
+
+    def test_editing_last_row_to_default_data_does_not_append_row(self):
+        self.assertTrue(self._model.setData(self._model.index(0, 0), "default name"))
+        self.assertEqual(self._model.rowCount(), 1)
+        self.assertEqual(self._row_data(0), ["default name", None])
+
+    def test_inserted_rows_get_default_data(self):
+        self.assertTrue(self._model.setData(self._model.index(0, 1), "my description"))
+        self.assertTrue(self._model.insertRows(1, 2))
+        self.assertEqual(self._model.rowCount(), 4)
+        self.assertEqual(self._row_data(0), ["default name", "my description"])
+        for row in range(1, 4):
+            self.assertEqual(self._row_data(row), ["default name", None])
+
+    def test_remove_rows_keeps_last_empty_row(self):
+        self.assertTrue(self._model.setData(self._model.index(0, 1), "my description"))
+        self.assertEqual(self._model.rowCount(), 2)
+        self.assertTrue(self._model.removeRows(0, 2))
+        self.assertEqual(self._model.rowCount(), 1)
+        self.assertEqual(self._row_data(0), ["default name", None])
+
+    def _row_data(self, row):
+        return [self._model.index(row, column).data() for column in range(self._model.columnCount())]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -94,6 +94,27 @@ class TestLeafProjectTreeItem(unittest.TestCase):
             self.assertIsNone(leaf.parent())
             clean_up_toolbox(toolbox)
 
+    def test_row_is_updated_when_siblings_are_removed(self):
+        parent = RootProjectTreeItem()
+        children = [CategoryProjectTreeItem(f"category {i}", "") for i in range(3)]
+        for child in children:
+            parent.add_child(child)
+        self.assertEqual([child.row() for child in children], [0, 1, 2])
+        parent.remove_child(0)
+        self.assertEqual(children[1].row(), 0)
+        self.assertEqual(children[2].row(), 1)
+
+    def test_row_is_correct_after_moving_item_to_another_parent(self):
+        old_parent = RootProjectTreeItem()
+        new_parent = RootProjectTreeItem()
+        child = CategoryProjectTreeItem("category", "")
+        new_parent.add_child(CategoryProjectTreeItem("sibling", ""))
+        old_parent.add_child(child)
+        self.assertEqual(child.row(), 0)
+        old_parent.remove_child(child.row())
+        new_parent.add_child(child)
+        self.assertEqual(child.row(), 1)
+
     @staticmethod
     def _category_item(project_dir):
         """Set up toolbox."""
@@ -81,6 +81,52 @@ class TestResourceFilterModel(unittest.TestCase):
             self.assertTrue(model.setData(my_tool_index, Qt.CheckState.Checked.value, Qt.ItemDataRole.CheckStateRole))
             self.assertEqual(model.data(my_tool_index, Qt.ItemDataRole.CheckStateRole), Qt.CheckState.Checked.value)
 
+    def test_build_tree_skips_rebuild_when_filters_are_unchanged(self):
+        connection, online = self._make_connection_with_filters()
+        project = mock.MagicMock()
+        with resource_filter_model(connection, project, self._undo_stack, self._logger) as model:
+            model.build_tree()
+            self.assertEqual(model.rowCount(), 1)
+            connection.get_scenario_names.reset_mock()
+            model.build_tree()
+            connection.get_scenario_names.assert_not_called()
+            self.assertEqual(model.rowCount(), 1)
+            online[TOOL_FILTER_TYPE] = {"my_tool": True}
+            model.build_tree()
+            connection.get_scenario_names.assert_called()
+            tool_root_index = model.index(1, 0, model.index(0, 0))
+            self.assertEqual(model.index(1, 0, tool_root_index).data(), "my_tool")
+
+    def test_build_tree_rebuilds_when_online_state_changes(self):
+        connection, online = self._make_connection_with_filters()
+        project = mock.MagicMock()
+        with resource_filter_model(connection, project, self._undo_stack, self._logger) as model:
+            model.build_tree()
+            scenario_root_index = model.index(0, 0, model.index(0, 0))
+            my_scenario_index = model.index(1, 0, scenario_root_index)
+            self.assertEqual(model.data(my_scenario_index, Qt.ItemDataRole.CheckStateRole), Qt.CheckState.Checked.value)
+            connection.get_scenario_names.reset_mock()
+            online[SCENARIO_FILTER_TYPE]["my_scenario"] = False
+            model.build_tree()
+            connection.get_scenario_names.assert_called()
+            scenario_root_index = model.index(0, 0, model.index(0, 0))
+            my_scenario_index = model.index(1, 0, scenario_root_index)
+            self.assertEqual(my_scenario_index.data(), "my_scenario")
+            self.assertEqual(
+                model.data(my_scenario_index, Qt.ItemDataRole.CheckStateRole), Qt.CheckState.Unchecked.value
+            )
+
+    @staticmethod
+    def _make_connection_with_filters():
+        connection = mock.MagicMock()
+        connection.database_resources = [database_resource("Data Store", "sqlite:///db.sqlite", filterable=True)]
+        online = {SCENARIO_FILTER_TYPE: {"my_scenario": True}, TOOL_FILTER_TYPE: {}}
+        connection.online_filters.side_effect = lambda resource_label, filter_type: dict(online[filter_type])
+        connection.get_scenario_names.side_effect = lambda url: sorted(online[SCENARIO_FILTER_TYPE])
+        connection.get_tool_names.side_effect = lambda url: sorted(online[TOOL_FILTER_TYPE])
+        connection.is_filter_online_by_default = True
+        return connection, online
+
 
 @contextmanager
 def resource_filter_model(connection, project, undo_stack, logger):
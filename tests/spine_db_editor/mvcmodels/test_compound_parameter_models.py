@@ -202,6 +202,41 @@ class TestCompoundObjectParameterValueModel(unittest.TestCase):
         expected = ["oc", "o", "p", "Base", "23.0", "test_db"]
         self.assertEqual(row, expected)
 
+    def test_clearing_entity_filter_shows_all_values_again(self):
+        model = CompoundObjectParameterValueModel(self._db_editor, self._db_mngr, self._db_map)
+        model.init_model()
+        if model.canFetchMore(None):
+            model.fetchMore(None)
+        self._db_mngr.add_object_classes({self._db_map: [{"name": "oc"}]})
+        self._db_mngr.add_parameter_definitions({self._db_map: [{"name": "p", "object_class_id": 1}]})
+        self._db_mngr.add_objects({self._db_map: [{"name": "o1", "class_id": 1}, {"name": "o2", "class_id": 1}]})
+        self._db_mngr.add_parameter_values(
+            {
+                self._db_map: [
+                    {
+                        "parameter_definition_id": 1,
+                        "value": value,
+                        "type": None,
+                        "object_id": object_id,
+                        "object_class_id": 1,
+                        "alternative_id": 1,
+                    }
+                    for object_id, value in ((1, b"23.0"), (2, b"5.0"))
+                ]
+            }
+        )
+        self.assertEqual(model.rowCount(), 3)
+        entity_ids = {(self._db_map, 1): {1}}
+        model.set_filter_entity_ids(entity_ids)
+        model.refresh()
+        self.assertEqual(model.rowCount(), 2)
+        self.assertEqual(model.index(0, 1).data(), "o1")
+        entity_ids.clear()
+        model.set_filter_entity_ids(entity_ids)
+        model.refresh()
+        self.assertEqual(model.rowCount(), 3)
+        self.assertEqual({model.index(row, 1).data() for row in range(2)}, {"o1", "o2"})
+
 
 class TestCompoundRelationshipParameterValueModel(unittest.TestCase):
     @classmethod
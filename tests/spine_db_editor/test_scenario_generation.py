@@ -0,0 +1,40 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# This file is part of Spine Toolbox.
+# Spine Toolbox is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""
+Unit tests for Database editor's ``scenario_generation`` module.
+"""
+import unittest
+from spinetoolbox.spine_db_editor.scenario_generation import all_combinations, unique_alternatives
+
+
+class TestAllCombinations(unittest.TestCase):
+    def test_empty_alternatives_produce_no_scenarios(self):
+        self.assertEqual(all_combinations([]), [])
+
+    def test_combinations_keep_alternative_order(self):
+        self.assertEqual(
+            all_combinations(["a", "b", "c"]),
+            [["a"], ["b"], ["c"], ["a", "b"], ["a", "c"], ["b", "c"], ["a", "b", "c"]],
+        )
+
+    def test_scenario_count_grows_as_power_of_two(self):
+        alternatives = list(range(12))
+        self.assertEqual(len(all_combinations(alternatives)), 2 ** len(alternatives) - 1)
+
+
+class TestUniqueAlternatives(unittest.TestCase):
+    def test_each_alternative_gets_own_scenario(self):
+        self.assertEqual(unique_alternatives(["a", "b"]), [["a"], ["b"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,10 +11,11 @@
 
 """Test for `scenario_generator` module."""
 import unittest
+from unittest.mock import patch
 
 from PySide6.QtCore import Qt
 
-from spinetoolbox.spine_db_editor.widgets.scenario_generator import ScenarioGenerator
+from spinetoolbox.spine_db_editor.widgets.scenario_generator import ScenarioGenerator, _ScenarioNameResolution
 from .helpers import TestBase
 
 
@@ -75,6 +76,34 @@ class TestScenarioGenerator(TestBase):
             },
         )
 
+    def test_keeping_existing_scenarios_attaches_alternatives_to_new_scenarios_only(self):
+        self._db_mngr.add_alternatives({self._db_map: [{"name": "alt0"}, {"name": "alt1"}]})
+        self._db_mngr.add_scenarios({self._db_map: [{"name": "S_2"}]})
+        alternative_ids = {a["name"]: a["id"] for a in self._db_mngr.get_items(self._db_map, "alternative")}
+        scenario_ids = {s["name"]: s["id"] for s in self._db_mngr.get_items(self._db_map, "scenario")}
+        self._db_mngr.set_scenario_alternatives(
+            {self._db_map: [{"id": scenario_ids["S_2"], "alternative_id_list": [alternative_ids["alt1"]]}]}
+        )
+        alternatives = self._db_mngr.get_items(self._db_map, "alternative")
+        scenario_generator = ScenarioGenerator(self._db_editor, self._db_map, alternatives, self._db_editor)
+        scenario_generator._ui.scenario_prefix_edit.setText("S_")
+        scenario_generator._ui.operation_combo_box.setCurrentText("Scenario for each alternative")
+        scenario_generator._ui.use_base_alternative_check_box.setCheckState(Qt.CheckState.Unchecked)
+        with patch.object(
+            ScenarioGenerator, "_check_existing_scenarios", return_value=_ScenarioNameResolution.LEAVE_AS_IS
+        ):
+            scenario_generator._ui.button_box.accepted.emit()
+        scenarios = self._db_mngr.get_items(self._db_map, "scenario")
+        scenario_id_to_name = {s["id"]: s["name"] for s in scenarios}
+        self.assertEqual(set(scenario_id_to_name.values()), {"S_1", "S_2", "S_3"})
+        alternative_id_to_name = {a["id"]: a["name"] for a in self._db_mngr.get_items(self._db_map, "alternative")}
+        scenario_alternatives = self._db_mngr.get_items(self._db_map, "scenario_alternative")
+        scenario_alternatives_by_name = {
+            scenario_id_to_name[item["scenario_id"]]: (alternative_id_to_name[item["alternative_id"]], item["rank"])
+            for item in scenario_alternatives
+        }
+        self.assertEqual(scenario_alternatives_by_name, {"S_1": ("Base", 1), "S_2": ("alt1", 1), "S_3": ("alt1", 1)})
+
 
 if __name__ == '__main__':
     unittest.main()
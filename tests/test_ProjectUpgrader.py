@@ -54,6 +54,11 @@ class TestProjectUpgrader(unittest.TestCase):
         """Runs after each test. Use this to free resources after a test if needed."""
         clean_up_toolbox(self.toolbox)
 
+    def test_upgrade_fails_gracefully_when_version_is_missing(self):
+        project_upgrader = ProjectUpgrader(self.toolbox)
+        with TemporaryDirectory() as project_dir:
+            self.assertFalse(project_upgrader.upgrade({"project": {}}, project_dir))
+
     def test_is_valid_v1(self):
         """Tests is_valid for a version 1 project dictionary."""
         p = make_v1_project_dict()
@@ -234,6 +234,27 @@ class TestAddItems(unittest.TestCase):
         db_map_data = {db_map: [{"entity_id": 1, "metadata_id": 1}]}
         self._db_mngr.add_items(db_map_data, "entity_metadata", callback=callback)
 
+    def test_add_entity_metadata_together_with_new_metadata(self):
+        db_map = DatabaseMapping(self._db_url, create=True)
+        import_functions.import_object_classes(db_map, ("my_class",))
+        import_functions.import_objects(db_map, (("my_class", "my_object"),))
+        import_functions.import_metadata(db_map, ('{"metaname": "metavalue"}',))
+        db_map.commit_session("Add test data.")
+        db_map.connection.close()
+        db_map = self._db_mngr.get_db_map(self._db_url, self._logger)
+        items_added_listener = MagicMock()
+        self._db_mngr.items_added.connect(items_added_listener)
+        callback = MagicMock()
+        db_map_data = {db_map: [{"name": "author", "value": "Anonymous"}, {"entity_id": 1, "metadata_id": 1}]}
+        self._db_mngr.add_items(db_map_data, "entity_metadata", callback=callback)
+        emitted = {item_type: data for item_type, data in (call.args for call in items_added_listener.call_args_list)}
+        self.assertEqual(set(emitted), {"metadata", "entity_metadata"})
+        self.assertEqual([item["name"] for item in emitted["metadata"][db_map]], ["author"])
+        self.assertEqual(
+            [(item["entity_id"], item["metadata_id"]) for item in emitted["entity_metadata"][db_map]], [(1, 1)]
+        )
+        callback.assert_called_once_with(emitted["entity_metadata"])
+
 
 class TestImportData(unittest.TestCase):
     @classmethod
@@ -206,6 +206,50 @@ class TestHelpers(unittest.TestCase):
             with open(overwritten_file) as input:
                 self.assertEqual(input.readline(), "source")
 
+    def test_recursive_overwrite_keeps_other_files_in_existing_destination(self):
+        with TemporaryDirectory() as temp_dir:
+            source_dir = Path(temp_dir, "source")
+            source_dir.mkdir()
+            (source_dir / "file").write_text("source")
+            destination_dir = Path(temp_dir, "destination")
+            destination_dir.mkdir()
+            (destination_dir / "file").write_text("destination")
+            (destination_dir / "other_file").write_text("other")
+            logger = MagicMock()
+            recursive_overwrite(logger, str(source_dir), str(destination_dir))
+            self.assertEqual((destination_dir / "file").read_text(), "source")
+            self.assertEqual((destination_dir / "other_file").read_text(), "other")
+
+    def test_recursive_overwrite_skips_destination_nested_in_source(self):
+        with TemporaryDirectory() as temp_dir:
+            source_dir = Path(temp_dir, "source")
+            source_dir.mkdir()
+            (source_dir / "file").write_text("source")
+            destination_dir = source_dir / "nested" / "destination"
+            logger = MagicMock()
+            recursive_overwrite(logger, str(source_dir), str(destination_dir))
+            self.assertEqual((destination_dir / "file").read_text(), "source")
+            self.assertFalse((destination_dir / "nested").exists())
+
+    def test_recursive_overwrite_respects_ignore(self):
+        with TemporaryDirectory() as temp_dir:
+            source_dir = Path(temp_dir, "source")
+            source_dir.mkdir()
+            (source_dir / "file").write_text("source")
+            (source_dir / "ignored_file").write_text("source")
+            sub_dir = source_dir / "subdir"
+            sub_dir.mkdir()
+            (sub_dir / "ignored_file").write_text("source")
+            destination_dir = Path(temp_dir, "destination")
+            logger = MagicMock()
+            recursive_overwrite(
+                logger, str(source_dir), str(destination_dir), ignore=lambda directory, files: {"ignored_file"}
+            )
+            self.assertTrue((destination_dir / "file").exists())
+            self.assertTrue((destination_dir / "subdir").is_dir())
+            self.assertFalse((destination_dir / "ignored_file").exists())
+            self.assertFalse((destination_dir / "subdir" / "ignored_file").exists())
+
     def test_tuple_itemgetter(self):
         def first(t):
             return t[0]